@@ -1,5 +1,7 @@
 """Tests for Glances."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 MOCK_USER_INPUT: dict[str, Any] = {
@@ -174,38 +176,45 @@ MOCK_DATA = {
     "uptime": "3 days, 10:25:20",
 }
 
-HA_SENSOR_DATA: dict[str, Any] = {
-    "fs": {
-        "/ssl": {"disk_use": 30.7, "disk_use_percent": 6.7, "disk_free": 426.5},
-        "/media": {"disk_use": 30.7, "disk_use_percent": 6.7, "disk_free": 426.5},
-    },
-    "sensors": {
-        "cpu_thermal 1": {"temperature_core": 59},
-        "err_temp": {"temperature_hdd": "Unavailable"},
-        "na_temp": {"temperature_hdd": "Unavailable"},
-    },
-    "mem": {
-        "memory_use_percent": 27.6,
-        "memory_use": 1047.1,
-        "memory_free": 2745.0,
-    },
-    "docker": {"docker_active": 2, "docker_cpu_use": 77.2, "docker_memory_use": 1149.6},
-    "raid": {
-        "md3": {
-            "status": "active",
-            "type": "raid1",
-            "components": {"sdh1": "2", "sdi1": "0"},
-            "available": "2",
-            "used": "2",
-            "config": "UU",
+# Shallow freeze: the nested sensor dicts are still mutable.
+HA_SENSOR_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "fs": {
+            "/ssl": {"disk_use": 30.7, "disk_use_percent": 6.7, "disk_free": 426.5},
+            "/media": {"disk_use": 30.7, "disk_use_percent": 6.7, "disk_free": 426.5},
         },
-        "md1": {
-            "status": "active",
-            "type": "raid1",
-            "components": {"sdg": "0", "sde": "1"},
-            "available": "2",
-            "used": "2",
-            "config": "UU",
+        "sensors": {
+            "cpu_thermal 1": {"temperature_core": 59},
+            "err_temp": {"temperature_hdd": "Unavailable"},
+            "na_temp": {"temperature_hdd": "Unavailable"},
         },
-    },
-}
+        "mem": {
+            "memory_use_percent": 27.6,
+            "memory_use": 1047.1,
+            "memory_free": 2745.0,
+        },
+        "docker": {
+            "docker_active": 2,
+            "docker_cpu_use": 77.2,
+            "docker_memory_use": 1149.6,
+        },
+        "raid": {
+            "md3": {
+                "status": "active",
+                "type": "raid1",
+                "components": {"sdh1": "2", "sdi1": "0"},
+                "available": "2",
+                "used": "2",
+                "config": "UU",
+            },
+            "md1": {
+                "status": "active",
+                "type": "raid1",
+                "components": {"sdg": "0", "sde": "1"},
+                "available": "2",
+                "used": "2",
+                "config": "UU",
+            },
+        },
+    }
+)
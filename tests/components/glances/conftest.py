@@ -1,16 +1,25 @@
 """Conftest for speedtestdotnet."""
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from . import HA_SENSOR_DATA
 
 
+@pytest.fixture(scope="module")
+def glances_api() -> MagicMock:
+    """Create the glances api mock once per module."""
+    mock_api = MagicMock()
+    mock_api.return_value.get_ha_sensor_data = AsyncMock(return_value=HA_SENSOR_DATA)
+    return mock_api
+
+
 @pytest.fixture(autouse=True)
-def mock_api():
+def mock_api(glances_api: MagicMock):
     """Mock glances api."""
-    with patch("homeassistant.components.glances.Glances") as mock_api:
-        mock_api.return_value.get_ha_sensor_data = AsyncMock(
-            return_value=HA_SENSOR_DATA
-        )
-        yield mock_api
+    with patch("homeassistant.components.glances.Glances", glances_api):
+        yield glances_api
+
+    # return_value is deliberately kept so the canned responses survive.
+    glances_api.reset_mock(side_effect=True)
+    glances_api.return_value.reset_mock(side_effect=True)
@@ -14,18 +14,20 @@ from homeassistant.data_entry_flow import FlowResultType
 
 from . import HA_SENSOR_DATA, MOCK_USER_INPUT
 
-from tests.common import MockConfigEntry, patch
+from tests.common import patch
 
 
 @pytest.fixture(autouse=True)
 def glances_setup_fixture():
     """Mock glances entry setup."""
-    with patch("homeassistant.components.glances.async_setup_entry", return_value=True):
+    with patch(
+        "homeassistant.components.glances.async_setup_entry", return_value=True
+    ), patch("homeassistant.components.glances.async_unload_entry", return_value=True):
         yield
 
 
-async def test_form(hass: HomeAssistant) -> None:
-    """Test config entry configured successfully."""
+async def test_config_flow_scenarios(hass: HomeAssistant, mock_api: MagicMock) -> None:
+    """Test the config flow success, error and already configured paths."""
 
     result = await hass.config_entries.flow.async_init(
         glances.DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -41,42 +43,30 @@ async def test_form(hass: HomeAssistant) -> None:
     assert result["title"] == "0.0.0.0:61208"
     assert result["data"] == MOCK_USER_INPUT
 
-
-@pytest.mark.parametrize(
-    ("error", "message"),
-    [
+    for error, message in (
         (GlancesApiAuthorizationError, "invalid_auth"),
         (GlancesApiConnectionError, "cannot_connect"),
-    ],
-)
-async def test_form_fails(
-    hass: HomeAssistant, error: Exception, message: str, mock_api: MagicMock
-) -> None:
-    """Test flow fails when api exception is raised."""
+    ):
+        await hass.config_entries.async_remove(result["result"].entry_id)
 
-    mock_api.return_value.get_ha_sensor_data.side_effect = [error, HA_SENSOR_DATA]
-    result = await hass.config_entries.flow.async_init(
-        glances.DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input=MOCK_USER_INPUT
-    )
+        mock_api.return_value.get_ha_sensor_data.side_effect = [error, HA_SENSOR_DATA]
+        result = await hass.config_entries.flow.async_init(
+            glances.DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=MOCK_USER_INPUT
+        )
 
-    assert result["type"] == FlowResultType.FORM
-    assert result["errors"] == {"base": message}
-
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input=MOCK_USER_INPUT
-    )
-
-    assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"] == {"base": message}
 
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input=MOCK_USER_INPUT
+        )
 
-async def test_form_already_configured(hass: HomeAssistant) -> None:
-    """Test host is already configured."""
-    entry = MockConfigEntry(domain=glances.DOMAIN, data=MOCK_USER_INPUT)
-    entry.add_to_hass(hass)
+        assert result["type"] == FlowResultType.CREATE_ENTRY
 
+    mock_api.return_value.get_ha_sensor_data.side_effect = None
     result = await hass.config_entries.flow.async_init(
         glances.DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
@@ -1,11 +1,10 @@
 """Tests for the withings component."""
 from dataclasses import dataclass
 from typing import Any
-from urllib.parse import urlparse
 
 from aiohttp.test_utils import TestClient
 
-from homeassistant.components.webhook import async_generate_url
+from homeassistant.components.webhook import async_generate_path
 from homeassistant.components.withings.const import CONF_USE_WEBHOOK, DOMAIN
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.core import HomeAssistant
@@ -26,12 +25,7 @@ async def call_webhook(
     hass: HomeAssistant, webhook_id: str, data: dict[str, Any], client: TestClient
 ) -> WebhookResponse:
     """Call the webhook."""
-    webhook_url = async_generate_url(hass, webhook_id)
-
-    resp = await client.post(
-        urlparse(webhook_url).path,
-        data=data,
-    )
+    resp = await client.post(async_generate_path(webhook_id), data=data)
 
     # Wait for remaining tasks to complete.
     await hass.async_block_till_done()
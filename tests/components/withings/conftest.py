@@ -15,6 +15,7 @@ from homeassistant.components.application_credentials import (
     ClientCredential,
     async_import_client_credential,
 )
+from homeassistant.components.webhook import async_generate_path
 from homeassistant.components.withings.api import ConfigEntryWithingsApi
 from homeassistant.components.withings.const import DOMAIN
 from homeassistant.core import HomeAssistant
@@ -33,6 +34,7 @@ SCOPES = [
 TITLE = "henk"
 USER_ID = 12345
 WEBHOOK_ID = "55a7335ea8dee830eed4ef8f84cda8f6d80b83af0847dc74032e86120bffed5e"
+WEBHOOK_PATH = async_generate_path(WEBHOOK_ID)
 
 
 @pytest.fixture(name="scopes")
@@ -111,9 +113,9 @@ def polling_config_entry(expires_at: int, scopes: list[str]) -> MockConfigEntry:
     )
 
 
-@pytest.fixture(name="withings")
-def mock_withings():
-    """Mock withings."""
+@pytest.fixture(name="withings_api", scope="module")
+def mock_withings_api() -> AsyncMock:
+    """Create the Withings API mock once per module."""
 
     mock = AsyncMock(spec=ConfigEntryWithingsApi)
     mock.user_get_device.return_value = UserGetDeviceResponse(
@@ -128,12 +130,21 @@ def mock_withings():
     mock.async_notify_list.return_value = NotifyListResponse(
         **load_json_object_fixture("withings/notify_list.json")
     )
+    return mock
+
+
+@pytest.fixture(name="withings")
+def mock_withings(withings_api: AsyncMock):
+    """Mock withings."""
 
     with patch(
         "homeassistant.components.withings.ConfigEntryWithingsApi",
-        return_value=mock,
+        return_value=withings_api,
     ):
-        yield mock
+        yield withings_api
+
+    # Only clear side effects; the fixture responses set above must stay.
+    withings_api.reset_mock(side_effect=True)
 
 
 @pytest.fixture(name="disable_webhook_delay")
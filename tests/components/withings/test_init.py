@@ -1,8 +1,8 @@
 """Tests for the Withings component."""
+import asyncio
 from datetime import timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
-from urllib.parse import urlparse
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -10,15 +10,13 @@ import voluptuous as vol
 from withings_api.common import AuthFailedException, NotifyAppli, UnauthorizedException
 
 from homeassistant import config_entries
-from homeassistant.components.webhook import async_generate_url
 from homeassistant.components.withings import CONFIG_SCHEMA, async_setup
 from homeassistant.components.withings.const import CONF_USE_WEBHOOK, DOMAIN
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_WEBHOOK_ID
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
 
 from . import call_webhook, enable_webhooks, setup_integration
-from .conftest import USER_ID, WEBHOOK_ID
+from .conftest import USER_ID, WEBHOOK_ID, WEBHOOK_PATH
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 from tests.typing import ClientSessionGenerator
@@ -31,69 +29,59 @@ def config_schema_validate(withings_config) -> dict:
     return CONFIG_SCHEMA(hass_config)
 
 
-def config_schema_assert_fail(withings_config) -> None:
-    """Assert a schema config will fail."""
-    with pytest.raises(vol.MultipleInvalid):
-        config_schema_validate(withings_config)
-
-
-def test_config_schema_basic_config() -> None:
-    """Test schema."""
-    config_schema_validate(
-        {
-            CONF_CLIENT_ID: "my_client_id",
-            CONF_CLIENT_SECRET: "my_client_secret",
-            CONF_USE_WEBHOOK: True,
-        }
-    )
-
-
-def test_config_schema_client_id() -> None:
-    """Test schema."""
-    config_schema_assert_fail(
-        {CONF_CLIENT_SECRET: "my_client_secret", CONF_CLIENT_ID: ""}
-    )
-    config_schema_validate(
-        {CONF_CLIENT_SECRET: "my_client_secret", CONF_CLIENT_ID: "my_client_id"}
-    )
-
-
-def test_config_schema_client_secret() -> None:
-    """Test schema."""
-    config_schema_assert_fail({CONF_CLIENT_ID: "my_client_id", CONF_CLIENT_SECRET: ""})
-    config_schema_validate(
-        {CONF_CLIENT_ID: "my_client_id", CONF_CLIENT_SECRET: "my_client_secret"}
-    )
-
-
-def test_config_schema_use_webhook() -> None:
+@pytest.mark.parametrize(
+    ("withings_config", "valid"),
+    [
+        (
+            {CONF_CLIENT_ID: "my_client_id", CONF_CLIENT_SECRET: "my_client_secret"},
+            True,
+        ),
+        (
+            {
+                CONF_CLIENT_ID: "my_client_id",
+                CONF_CLIENT_SECRET: "my_client_secret",
+                CONF_USE_WEBHOOK: True,
+            },
+            True,
+        ),
+        (
+            {
+                CONF_CLIENT_ID: "my_client_id",
+                CONF_CLIENT_SECRET: "my_client_secret",
+                CONF_USE_WEBHOOK: False,
+            },
+            True,
+        ),
+        ({CONF_CLIENT_SECRET: "my_client_secret", CONF_CLIENT_ID: ""}, False),
+        ({CONF_CLIENT_ID: "my_client_id", CONF_CLIENT_SECRET: ""}, False),
+        (
+            {
+                CONF_CLIENT_ID: "my_client_id",
+                CONF_CLIENT_SECRET: "my_client_secret",
+                CONF_USE_WEBHOOK: "A",
+            },
+            False,
+        ),
+    ],
+    ids=[
+        "basic_config",
+        "use_webhook_true",
+        "use_webhook_false",
+        "empty_client_id",
+        "empty_client_secret",
+        "invalid_use_webhook",
+    ],
+)
+def test_config_schema(withings_config: dict[str, Any], valid: bool) -> None:
     """Test schema."""
-    config_schema_validate(
-        {CONF_CLIENT_ID: "my_client_id", CONF_CLIENT_SECRET: "my_client_secret"}
-    )
-    config = config_schema_validate(
-        {
-            CONF_CLIENT_ID: "my_client_id",
-            CONF_CLIENT_SECRET: "my_client_secret",
-            CONF_USE_WEBHOOK: True,
-        }
-    )
-    assert config[DOMAIN][CONF_USE_WEBHOOK] is True
-    config = config_schema_validate(
-        {
-            CONF_CLIENT_ID: "my_client_id",
-            CONF_CLIENT_SECRET: "my_client_secret",
-            CONF_USE_WEBHOOK: False,
-        }
-    )
-    assert config[DOMAIN][CONF_USE_WEBHOOK] is False
-    config_schema_assert_fail(
-        {
-            CONF_CLIENT_ID: "my_client_id",
-            CONF_CLIENT_SECRET: "my_client_secret",
-            CONF_USE_WEBHOOK: "A",
-        }
-    )
+    if valid:
+        config = config_schema_validate(withings_config)
+        assert config[DOMAIN].get(CONF_USE_WEBHOOK) is withings_config.get(
+            CONF_USE_WEBHOOK
+        )
+    else:
+        with pytest.raises(vol.MultipleInvalid):
+            config_schema_validate(withings_config)
 
 
 async def test_async_setup_no_config(hass: HomeAssistant) -> None:
@@ -110,29 +98,40 @@ async def test_data_manager_webhook_subscription(
     withings: AsyncMock,
     disable_webhook_delay,
     webhook_config_entry: MockConfigEntry,
-    hass_client_no_auth: ClientSessionGenerator,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test data manager webhook subscriptions."""
+    subscribed = asyncio.Event()
+
+    def _subscribe(*args: Any) -> None:
+        if withings.async_notify_subscribe.call_count == 4:
+            subscribed.set()
+
+    withings.async_notify_subscribe.side_effect = _subscribe
+
     await enable_webhooks(hass)
     await setup_integration(hass, webhook_config_entry)
-    await hass_client_no_auth()
-    await hass.async_block_till_done()
-    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
-    await hass.async_block_till_done()
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await asyncio.wait_for(subscribed.wait(), 1)
 
     assert withings.async_notify_subscribe.call_count == 4
 
-    webhook_url = "http://example.local:8123/api/webhook/55a7335ea8dee830eed4ef8f84cda8f6d80b83af0847dc74032e86120bffed5e"
-
-    withings.async_notify_subscribe.assert_any_call(webhook_url, NotifyAppli.WEIGHT)
-    withings.async_notify_subscribe.assert_any_call(
-        webhook_url, NotifyAppli.CIRCULATORY
-    )
-    withings.async_notify_subscribe.assert_any_call(webhook_url, NotifyAppli.ACTIVITY)
-    withings.async_notify_subscribe.assert_any_call(webhook_url, NotifyAppli.SLEEP)
+    webhook_url = f"http://example.local:8123{WEBHOOK_PATH}"
 
-    withings.async_notify_revoke.assert_any_call(webhook_url, NotifyAppli.BED_IN)
-    withings.async_notify_revoke.assert_any_call(webhook_url, NotifyAppli.BED_OUT)
+    assert {call.args for call in withings.async_notify_subscribe.call_args_list} == {
+        (webhook_url, appli)
+        for appli in (
+            NotifyAppli.WEIGHT,
+            NotifyAppli.CIRCULATORY,
+            NotifyAppli.ACTIVITY,
+            NotifyAppli.SLEEP,
+        )
+    }
+    assert {
+        (webhook_url, NotifyAppli.BED_IN),
+        (webhook_url, NotifyAppli.BED_OUT),
+    } <= {call.args for call in withings.async_notify_revoke.call_args_list}
 
 
 async def test_webhook_subscription_polling_config(
@@ -140,12 +139,10 @@ async def test_webhook_subscription_polling_config(
     withings: AsyncMock,
     disable_webhook_delay,
     polling_config_entry: MockConfigEntry,
-    hass_client_no_auth: ClientSessionGenerator,
     freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test webhook subscriptions not run when polling."""
     await setup_integration(hass, polling_config_entry)
-    await hass_client_no_auth()
     await hass.async_block_till_done()
     freezer.tick(timedelta(seconds=1))
     async_fire_time_changed(hass)
@@ -175,12 +172,8 @@ async def test_requests(
     await enable_webhooks(hass)
     await setup_integration(hass, webhook_config_entry)
     client = await hass_client_no_auth()
-    webhook_url = async_generate_url(hass, WEBHOOK_ID)
 
-    response = await client.request(
-        method=method,
-        path=urlparse(webhook_url).path,
-    )
+    response = await client.request(method=method, path=WEBHOOK_PATH)
     assert response.status == 200
 
 
@@ -219,13 +212,14 @@ async def test_triggering_reauth(
     withings: AsyncMock,
     polling_config_entry: MockConfigEntry,
     error: Exception,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test triggering reauth."""
     await setup_integration(hass, polling_config_entry)
 
     withings.async_measure_get_meas.side_effect = error
-    future = dt_util.utcnow() + timedelta(minutes=10)
-    async_fire_time_changed(hass, future)
+    freezer.tick(timedelta(minutes=10))
+    async_fire_time_changed(hass)
     await hass.async_block_till_done()
 
     flows = hass.config_entries.flow.async_progress()
@@ -238,33 +232,26 @@ async def test_triggering_reauth(
 
 
 @pytest.mark.parametrize(
-    ("config_entry"),
+    "entry_data",
     [
-        MockConfigEntry(
-            domain=DOMAIN,
-            unique_id="123",
-            data={
-                "token": {"userid": 123},
-                "profile": "henk",
-                "use_webhook": False,
-                "webhook_id": "3290798afaebd28519c4883d3d411c7197572e0cc9b8d507471f59a700a61a55",
-            },
-        ),
-        MockConfigEntry(
-            domain=DOMAIN,
-            unique_id="123",
-            data={
-                "token": {"userid": 123},
-                "profile": "henk",
-                "use_webhook": False,
-            },
-        ),
+        {
+            "token": {"userid": 123},
+            "profile": "henk",
+            "use_webhook": False,
+            "webhook_id": "3290798afaebd28519c4883d3d411c7197572e0cc9b8d507471f59a700a61a55",
+        },
+        {
+            "token": {"userid": 123},
+            "profile": "henk",
+            "use_webhook": False,
+        },
     ],
 )
 async def test_config_flow_upgrade(
-    hass: HomeAssistant, config_entry: MockConfigEntry
+    hass: HomeAssistant, entry_data: dict[str, Any]
 ) -> None:
     """Test config flow upgrade."""
+    config_entry = MockConfigEntry(domain=DOMAIN, unique_id="123", data=entry_data)
     config_entry.add_to_hass(hass)
 
     await hass.config_entries.async_setup(config_entry.entry_id)
@@ -280,43 +267,37 @@ async def test_config_flow_upgrade(
     }
 
 
-@pytest.mark.parametrize(
-    ("body", "expected_code"),
-    [
-        [{"userid": 0, "appli": NotifyAppli.WEIGHT.value}, 0],  # Success
-        [{"userid": None, "appli": 1}, 0],  # Success, we ignore the user_id.
-        [{}, 12],  # No request body.
-        [{"userid": "GG"}, 20],  # appli not provided.
-        [{"userid": 0}, 20],  # appli not provided.
-        [{"userid": 0, "appli": 99}, 21],  # Invalid appli.
-        [
-            {"userid": 11, "appli": NotifyAppli.WEIGHT.value},
-            0,
-        ],  # Success, we ignore the user_id
-    ],
-)
 async def test_webhook_post(
     hass: HomeAssistant,
     withings: AsyncMock,
     webhook_config_entry: MockConfigEntry,
     hass_client_no_auth: ClientSessionGenerator,
     disable_webhook_delay,
-    body: dict[str, Any],
-    expected_code: int,
     current_request_with_host: None,
 ) -> None:
     """Test webhook callback."""
     await enable_webhooks(hass)
     await setup_integration(hass, webhook_config_entry)
     client = await hass_client_no_auth()
-    webhook_url = async_generate_url(hass, WEBHOOK_ID)
 
-    resp = await client.post(urlparse(webhook_url).path, data=body)
+    for body, expected_code in (
+        ({"userid": 0, "appli": NotifyAppli.WEIGHT.value}, 0),  # Success
+        ({"userid": None, "appli": 1}, 0),  # Success, we ignore the user_id.
+        ({}, 12),  # No request body.
+        ({"userid": "GG"}, 20),  # appli not provided.
+        ({"userid": 0}, 20),  # appli not provided.
+        ({"userid": 0, "appli": 99}, 21),  # Invalid appli.
+        (
+            {"userid": 11, "appli": NotifyAppli.WEIGHT.value},
+            0,
+        ),  # Success, we ignore the user_id
+    ):
+        resp = await client.post(WEBHOOK_PATH, data=body)
 
-    # Wait for remaining tasks to complete.
-    await hass.async_block_till_done()
+        # Wait for remaining tasks to complete.
+        await hass.async_block_till_done()
 
-    data = await resp.json()
-    resp.close()
+        data = await resp.json()
+        resp.close()
 
-    assert data["code"] == expected_code
+        assert data["code"] == expected_code, body
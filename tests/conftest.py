@@ -106,6 +106,8 @@ _LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
+# The test helpers (e.g. async_fire_time_changed) inspect loop._scheduled,
+# which only exists on the pure Python loop, so uvloop can't be used here.
 asyncio.set_event_loop_policy(runner.HassEventLoopPolicy(False))
 # Disable fixtures overriding our beautiful policy
 asyncio.set_event_loop_policy = lambda policy: None